@@ -1,19 +1,77 @@
 import argparse
+import copy
 import pathlib
 import sys
-from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
 from typing import IO, Any, Dict, List, Optional, Tuple, Union
 
 import omegaconf
+import yaml
 from omegaconf import DictConfig, ListConfig
 
+# Use the libyaml-backed loader when PyYAML is compiled against it. It parses
+# identically to the pure-Python SafeLoader but is several times faster.
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# Parsed YAML files keyed by resolved path, holding (st_mtime_ns, container).
+# Repeated parse_config calls on the same unmodified file skip the parse
+# entirely; editing the file replaces its single entry, so a long-lived
+# process caches at most one tree per file.
+_YAML_CACHE: Dict[str, Tuple[int, Any]] = {}
+
+# Minimum file size (bytes) before parse_configs spins up a process pool;
+# below this the fork/pickle overhead outweighs the parallel parse.
+_PARALLEL_YAML_MIN_SIZE = 1 << 20
+
+
+def _load_yaml_file(path: Union[str, pathlib.Path]) -> Any:
+    """_load_yaml_file Parse a single YAML file into a plain container
+
+    Module-level so it is picklable for ProcessPoolExecutor workers.
+
+    Args:
+        path (Union[str, pathlib.Path]): YAML file to parse
+
+    Returns:
+        Any: The parsed plain container (usually a dict)
+    """
+    # Binary mode hands the loader raw UTF-8 bytes and skips the
+    # decode-into-str pass; the large buffer keeps read syscalls few.
+    with open(path, "rb", buffering=1 << 16) as fd:
+        return yaml.load(fd, Loader=_YAML_LOADER)
+
+
+def _cached_yaml_container(path: Union[str, pathlib.Path]) -> Any:
+    """_cached_yaml_container Fetch the parsed plain container for a YAML file through the mtime cache
+
+    Callers must not mutate the returned container; take a copy before
+    merging into it.
+
+    Args:
+        path (Union[str, pathlib.Path]): YAML file to parse
+
+    Returns:
+        Any: The parsed plain container (usually a dict)
+    """
+    path = pathlib.Path(path)
+    key = str(path.resolve())
+    mtime = path.stat().st_mtime_ns
+    cached = _YAML_CACHE.get(key)
+
+    if cached is None or cached[0] != mtime:
+        cached = (mtime, _load_yaml_file(path))
+        _YAML_CACHE[key] = cached
+
+    return cached[1]
+
 
 def _nest(
     d: Dict[str, Any], separator: str = ".", include_none: bool = False
 ) -> Optional[Dict[str, Any]]:
-    """_nest Recursive function to nest a dictionary on keys with . (dots)
+    """_nest Nest a flat dictionary on keys with . (dots)
 
-    Parse documentation into a hierarchical dict. Keys should be separated by dots (e.g. "model.hidden") to go down into the hierarchy
+    Parse documentation into a hierarchical dict. Keys should be separated by dots (e.g. "model.hidden") to go down into the hierarchy.
+    Each key is split once and the tree is built with a single iterative walk, so no recursion or string re-joining is involved.
 
     Args:
         d (Dict[str, Any]): dictionary containing flat config values
@@ -27,23 +85,271 @@ def _nest(
         >>> _nest({{"model.hidden": 20, "optimizer.lr": 1e-3}})
         {"model": {"hidden": 20}, "optimizer": {"lr": 1e-3}}
     """
-    nested: Dict[str, Any] = defaultdict(dict)
+    nested: Dict[str, Any] = {}
 
     for key, val in d.items():
-        if "." in key:
-            splitkeys = key.split(".")
-            inner = _nest({".".join(splitkeys[1:]): val})
+        if val is None and not include_none:
+            continue
+
+        *parents, leaf = key.split(separator)
+        cur = nested
+
+        for part in parents:
+            nxt = cur.get(part)
 
-            if inner is not None:
-                nested[splitkeys[0]].update(inner)
+            if not isinstance(nxt, dict):
+                nxt = {}
+                cur[part] = nxt
+
+            cur = nxt
+
+        cur[leaf] = val
+
+    return nested or None
+
+
+def _insert(root: Dict[str, Any], parts: List[str], val: Any) -> None:
+    """_insert Assign a value into a nested dict following a pre-split key path
+
+    Args:
+        root (Dict[str, Any]): Tree to insert into, modified in place
+        parts (List[str]): Key path, e.g. ["model", "hidden"]
+        val (Any): Leaf value to assign
+    """
+    cur = root
+
+    for part in parts[:-1]:
+        nxt = cur.get(part)
+
+        if not isinstance(nxt, dict):
+            nxt = {}
+            cur[part] = nxt
+
+        cur = nxt
+
+    cur[parts[-1]] = val
+
+
+def _deep_update(dst: Dict[str, Any], src: Dict[str, Any]) -> None:
+    """_deep_update Recursively merge src into dst, modifying dst in place
+
+    Values in src take precedence. Nested dicts are merged key-by-key, any
+    other value (including lists) is overwritten wholesale, matching
+    OmegaConf.merge semantics for plain containers.
+
+    Args:
+        dst (Dict[str, Any]): Tree to merge into, modified in place
+        src (Dict[str, Any]): Tree whose values take precedence
+    """
+    for k, v in src.items():
+        if isinstance(v, dict) and isinstance(dst.get(k), dict):
+            _deep_update(dst[k], v)
         else:
-            if val is not None:
-                nested[key] = val
+            dst[k] = v
+
 
-            if val is None and include_none:
-                nested[key] = val
+def _has_interpolation(node: Any) -> bool:
+    """_has_interpolation Check whether a plain container holds OmegaConf interpolations (``${...}``)
 
-    return dict(nested) if nested else None
+    Args:
+        node (Any): Plain container or scalar to scan
+
+    Returns:
+        bool: True if any string in the tree contains an interpolation marker
+    """
+    if isinstance(node, dict):
+        return any(_has_interpolation(v) for v in node.values())
+
+    if isinstance(node, list):
+        return any(_has_interpolation(v) for v in node)
+
+    return isinstance(node, str) and "${" in node
+
+
+def _plain_tree(cfg: Union[DictConfig, ListConfig]) -> Optional[Dict[str, Any]]:
+    """_plain_tree Extract the plain-dict container of a config, if it has no OmegaConf-specific semantics
+
+    Returns None for ListConfigs and for trees containing interpolations
+    (``${...}``), which need a real OmegaConf.merge to resolve correctly.
+
+    Args:
+        cfg (Union[DictConfig, ListConfig]): Config to convert
+
+    Returns:
+        Optional[Dict[str, Any]]: The plain container, or None if the config needs OmegaConf.merge
+    """
+    if not isinstance(cfg, DictConfig):
+        return None
+
+    container = omegaconf.OmegaConf.to_container(cfg, resolve=False)
+
+    return None if _has_interpolation(container) else container  # type: ignore
+
+
+def _merge_configs(
+    tomerge: List[Union[DictConfig, ListConfig]]
+) -> Union[ListConfig, DictConfig]:
+    """_merge_configs Merge configs, later entries taking precedence
+
+    When every input is a plain DictConfig (no interpolations, no list roots)
+    the underlying containers are merged with a recursive dict update and a
+    single DictConfig is constructed, skipping the validation and deep copies
+    OmegaConf.merge performs per input. Otherwise falls back to
+    OmegaConf.merge.
+
+    Args:
+        tomerge (List[Union[DictConfig, ListConfig]]): Configs to merge, in increasing precedence
+
+    Returns:
+        Union[ListConfig, DictConfig]: The merged configuration
+    """
+    trees = [_plain_tree(cfg) for cfg in tomerge]
+
+    if all(tree is not None for tree in trees):
+        merged: Dict[str, Any] = {}
+
+        for tree in trees:
+            _deep_update(merged, tree)  # type: ignore[arg-type]
+
+        return OmegaConf.create(merged)
+
+    return OmegaConf.merge(*tomerge)
+
+
+def _dest_to_arg(parser: argparse.ArgumentParser) -> Dict[str, Tuple[str, ...]]:
+    """_dest_to_arg Map argparse destinations to all of their option strings
+
+    The mapping is cached on the parser and rebuilt lazily when new actions
+    are registered, so repeated from_argparse calls don't redo the
+    introspection. Iterating parser._actions visits each action exactly once
+    (parser._option_string_actions holds one entry per alias). Every alias is
+    kept, so an argument registered as ("-n", "--num") is classified as user
+    provided whichever form appears on the command line.
+
+    Args:
+        parser (argparse.ArgumentParser): Parser to inspect
+
+    Returns:
+        Dict[str, Tuple[str, ...]]: Mapping from dest (e.g. "model.hidden") to its option strings (e.g. ("-n", "--num"))
+    """
+    n_actions = len(parser._actions)
+    cached = parser.__dict__.get("_omegacli_d2a")
+
+    if cached is not None and cached[0] == n_actions:
+        return cached[1]
+
+    dest_to_arg = {
+        action.dest: tuple(action.option_strings)
+        for action in parser._actions
+        if action.option_strings
+    }
+    parser._omegacli_d2a = (n_actions, dest_to_arg)
+
+    return dest_to_arg
+
+
+def _argparse_builder(
+    parser: argparse.ArgumentParser,
+    values: Dict[str, Any],
+    dest_to_arg: Dict[str, Tuple[str, ...]],
+):
+    """_argparse_builder Compile a builder specialized to the parser's destinations
+
+    The set of dests is fixed once the parser is built, so on first call we
+    generate and compile a function with the tree-assignment path for every
+    dest hardcoded. Subsequent from_argparse calls run a linear sequence of
+    assignments with no key splitting or generic loop overhead. The compiled
+    function is cached on the parser and regenerated if actions are added.
+
+    Args:
+        parser (argparse.ArgumentParser): Parser the builder is specialized to
+        values (Dict[str, Any]): A parsed namespace __dict__, used as the template for the dest set
+        dest_to_arg (Dict[str, Tuple[str, ...]]): Mapping from dest to its option strings
+
+    Returns:
+        Callable: ``build(values, provided, defaults, seen, include_none)`` filling both trees in place
+    """
+    n_actions = len(parser._actions)
+    cached = parser.__dict__.get("_omegacli_builder")
+
+    if cached is not None and cached[0] == n_actions:
+        return cached[1]
+
+    lines = ["def _build(values, provided, defaults, seen, include_none):"]
+
+    if not values:
+        lines.append("    pass")
+
+    for dest in values:
+        *parents, leaf = dest.split(".")
+        path = "".join(f".setdefault({part!r}, {{}})" for part in parents)
+        opts = dest_to_arg[dest]
+        # Any alias marks the dest as user provided; single-alias dests get
+        # the cheaper plain membership test.
+        if len(opts) == 1:
+            test = f"{opts[0]!r} in seen"
+        else:
+            test = f"not seen.isdisjoint({opts!r})"
+        lines.append(f"    v = values[{dest!r}]")
+        lines.append("    if v is not None or include_none:")
+        lines.append(f"        t = provided if {test} else defaults")
+        lines.append(f"        t{path}[{leaf!r}] = v")
+
+    namespace: Dict[str, Any] = {}
+    exec(compile("\n".join(lines), "<omegacli builder>", "exec"), namespace)
+    builder = namespace["_build"]
+    parser._omegacli_builder = (n_actions, builder)
+
+    return builder
+
+
+class LazyConfig:
+    """LazyConfig Deferred-loading stand-in for a YAML-backed config
+
+    Wraps a YAML source and postpones parsing until the first key or
+    attribute access, then delegates everything to the materialized
+    DictConfig. Useful when a config is loaded eagerly at import time but
+    only sometimes read.
+
+    Args:
+        file_ (Union[str, pathlib.Path, IO[Any]]): file to load or file descriptor
+    """
+
+    __slots__ = ("_file", "_cfg")
+
+    def __init__(self, file_: Union[str, pathlib.Path, IO[Any]]):
+        self._file = file_
+        self._cfg: Optional[Union[DictConfig, ListConfig]] = None
+
+    def _materialize(self) -> Union[DictConfig, ListConfig]:
+        if self._cfg is None:
+            self._cfg = OmegaConf.from_yaml(self._file)
+
+        return self._cfg
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._materialize(), name)
+
+    def __getitem__(self, key: Any) -> Any:
+        return self._materialize()[key]
+
+    def __setitem__(self, key: Any, value: Any) -> None:
+        self._materialize()[key] = value
+
+    def __contains__(self, key: Any) -> bool:
+        return key in self._materialize()
+
+    def __iter__(self):
+        return iter(self._materialize())
+
+    def __len__(self) -> int:
+        return len(self._materialize())
+
+    def __repr__(self) -> str:
+        if self._cfg is None:
+            return f"LazyConfig(unloaded: {self._file!r})"
+
+        return repr(self._cfg)
 
 
 class OmegaConf(omegaconf.OmegaConf):
@@ -57,9 +363,16 @@ class OmegaConf(omegaconf.OmegaConf):
     def from_yaml(
         file_: Union[str, pathlib.Path, IO[Any]]
     ) -> Union[DictConfig, ListConfig]:
-        """Alias for OmegaConf.load
+        """Load a YAML file into a configuration object
         OmegaConf.from_yaml got removed at some point. Bring it back
 
+        The YAML is parsed directly from the stream with PyYAML's C loader when
+        available (falling back to the pure-Python SafeLoader), which is
+        considerably faster than going through omegaconf.OmegaConf.load.
+        Filesystem paths are additionally cached on (path, mtime), so reparsing
+        an unmodified file only costs a fresh OmegaConf.create. File
+        descriptors bypass the cache.
+
         Args:
             file_ (Union[str, pathlib.Path, IO[Any]]): file to load or file descriptor
 
@@ -67,7 +380,30 @@ class OmegaConf(omegaconf.OmegaConf):
             Union[DictConfig, ListConfig]: The loaded configuration
 
         """
-        return OmegaConf.load(file_)
+        if isinstance(file_, (str, pathlib.Path)):
+            # OmegaConf.create copies the plain container into fresh config
+            # nodes, so downstream merges cannot poison the cache.
+            return OmegaConf.create(_cached_yaml_container(file_))
+
+        data = yaml.load(file_, Loader=_YAML_LOADER)
+
+        return OmegaConf.create(data)
+
+    @staticmethod
+    def from_yaml_lazy(file_: Union[str, pathlib.Path, IO[Any]]) -> LazyConfig:
+        """Lazy variant of from_yaml
+
+        Returns immediately without touching the file; the YAML is parsed on
+        the first key or attribute access. If the config is never read, the
+        parse cost is never paid.
+
+        Args:
+            file_ (Union[str, pathlib.Path, IO[Any]]): file to load or file descriptor
+
+        Returns:
+            LazyConfig: Proxy that materializes the configuration on first access
+        """
+        return LazyConfig(file_)
 
     @staticmethod
     def from_argparse(
@@ -103,22 +439,84 @@ class OmegaConf(omegaconf.OmegaConf):
             >>> default_args
             {'model': {'hidden': 20}}
         """
-        dest_to_arg = {v.dest: k for k, v in parser._option_string_actions.items()}
+        provided_tree, default_tree = OmegaConf.from_argparse_raw(
+            parser, args=args, include_none=include_none
+        )
 
-        all_args = vars(parser.parse_args(args=args))
-        provided_args = {}
-        default_args = {}
+        # Fresh configs even when a tree is empty: DictConfigs are mutable,
+        # so handing out a shared empty sentinel would let one caller's
+        # mutation leak into every later call.
+        provided = OmegaConf.create(provided_tree)
+        defaults = OmegaConf.create(default_tree)
+
+        return provided, defaults
+
+    @staticmethod
+    def from_argparse_raw(
+        parser: argparse.ArgumentParser,
+        args: Optional[List[str]] = None,
+        include_none: bool = False,
+    ) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        """from_argparse_raw Like from_argparse, but returns plain nested dicts
 
-        for k, v in all_args.items():
-            if dest_to_arg[k] in sys.argv:
-                provided_args[k] = v
-            else:
-                default_args[k] = v
+        Used on the parse_config hot path, where the trees are merged with
+        plain dict updates and only the final result is turned into a
+        DictConfig. Results are memoized on the parser per (argv,
+        include_none, action count), and a deep copy of the memoized pair is
+        returned each call, so callers are free to mutate the results.
 
-        provided = OmegaConf.create(_nest(provided_args, include_none=include_none))
-        defaults = OmegaConf.create(_nest(default_args, include_none=include_none))
+        Args:
+            parser (argparse.ArgumentParser): Parser for argparse arguments
+            args (Optional[List[str]]): Optional input sys.argv style args. Useful for testing.
+                Use this only for testing. By default it uses sys.argv[1:]
+            include_none (bool): If true includes none values in the trees
 
-        return provided, defaults
+        Returns:
+            Tuple[Dict[str, Any], Dict[str, Any]]: (user provided cli args, default cli args) as plain nested dicts
+        """
+        # Memoized on the parser itself, so different parsers don't collide
+        # and the cache dies with the parser. parse_config is commonly called
+        # more than once per process (e.g. in library init paths), and
+        # identical argv always yields identical trees. The action count in
+        # the key invalidates the memo when new options are registered, like
+        # the _dest_to_arg and _argparse_builder caches.
+        key = (
+            tuple(sys.argv[1:]) if args is None else tuple(args),
+            include_none,
+            len(parser._actions),
+        )
+        cache = parser.__dict__.setdefault("_omegacli_cache", {})
+        cached = cache.get(key)
+
+        if cached is not None:
+            # Copies, because parse_config merges into the default tree in
+            # place and callers may mutate theirs too.
+            return copy.deepcopy(cached[0]), copy.deepcopy(cached[1])
+
+        dest_to_arg = _dest_to_arg(parser)
+
+        ns = parser.parse_args(args=args)
+        provided_tree: Dict[str, Any] = {}
+        default_tree: Dict[str, Any] = {}
+
+        # Option heads seen on the command line. Tokens may come as
+        # "--foo=bar", so strip at the first "=" before membership tests.
+        argv = sys.argv[1:] if args is None else args
+        seen = {
+            tok.split("=", 1)[0]
+            for tok in argv
+            if isinstance(tok, str) and tok.startswith("-")
+        }
+
+        # Classify and nest in a single pass over the namespace __dict__ with
+        # a builder compiled for this parser's destinations, so no key
+        # splitting happens at call time.
+        build = _argparse_builder(parser, ns.__dict__, dest_to_arg)
+        build(ns.__dict__, provided_tree, default_tree, seen, include_none)
+
+        cache[key] = (copy.deepcopy(provided_tree), copy.deepcopy(default_tree))
+
+        return provided_tree, default_tree
 
 
 def parse_config(
@@ -169,23 +567,98 @@ def parse_config(
     """
     # Merge Configurations Precedence: default kwarg values < default argparse values < config file values < user provided CLI args values
 
-    if config_file is not None:
-        dict_config = OmegaConf.from_yaml(config_file)  # type: ignore
+    user_tree, default_tree = OmegaConf.from_argparse_raw(
+        parser, include_none=include_none, args=args
+    )
+
+    if config_file is None:
+        yaml_tree: Any = {}
+    elif isinstance(config_file, (str, pathlib.Path)):
+        # Copy so the merge below cannot mutate the cached container.
+        yaml_tree = copy.deepcopy(_cached_yaml_container(config_file))
+    else:
+        yaml_tree = yaml.load(config_file, Loader=_YAML_LOADER)
+
+    if yaml_tree is None:
+        yaml_tree = {}
+
+    if isinstance(yaml_tree, dict) and not _has_interpolation(yaml_tree):
+        # All three stages stay plain dicts; a single DictConfig is
+        # constructed at the end, with no OmegaConf-internal deep copies.
+        merged = default_tree
+
+        if not use_only_default:
+            _deep_update(merged, yaml_tree)
+            _deep_update(merged, user_tree)
+
+        config: Union[ListConfig, DictConfig] = OmegaConf.create(merged)
+    else:
+        # List roots and interpolations need real OmegaConf.merge semantics.
+        configs = (
+            [
+                OmegaConf.create(default_tree),
+                OmegaConf.create(yaml_tree),
+                OmegaConf.create(user_tree),
+            ]
+            if not use_only_default
+            else [OmegaConf.create(default_tree)]
+        )
+        tomerge = [cfg for cfg in configs if cfg is not None and len(cfg.keys()) > 0]
+        config = OmegaConf.merge(*tomerge)
+
+    return config
+
+
+def parse_configs(
+    parser: argparse.ArgumentParser,
+    config_files: List[Union[str, pathlib.Path]],
+    args: Optional[List[str]] = None,
+    include_none: bool = False,
+) -> Union[ListConfig, DictConfig]:
+    """parse_configs Parse multiple YAML config files and command line args and merge them
+
+    Like parse_config, but composes a configuration out of several YAML
+    fragments (e.g. model.yaml, data.yaml, optim.yaml). Later files override
+    earlier ones, and the overall precedence is
+       * user provided cli args > config file values (last file wins) > default cli args values
+    When at least two files are given and any of them is large, the YAML
+    parsing is spread over a process pool; otherwise the files are parsed
+    serially.
+
+    Args:
+        parser (argparse.ArgumentParser): The argument parser you want to use
+        config_files (List[Union[str, pathlib.Path]]): Configuration file names, in increasing precedence
+        args (Optional[List[str]]): Optional input sys.argv style args. Useful for testing.
+            Use this only for testing. By default it uses sys.argv[1:]
+        include_none (bool): Include none values in the final config
+
+    Returns:
+        OmegaConf.DictConfig: The parsed configuration as an OmegaConf DictConfig object
+    """
+    paths = [pathlib.Path(f) for f in config_files]
+
+    if len(paths) >= 2 and any(
+        p.stat().st_size >= _PARALLEL_YAML_MIN_SIZE for p in paths
+    ):
+        with ProcessPoolExecutor() as pool:
+            yaml_trees = list(pool.map(_load_yaml_file, paths))
     else:
-        dict_config = OmegaConf.create({})
+        yaml_trees = [_load_yaml_file(p) for p in paths]
+
+    yaml_tree: Dict[str, Any] = {}
+
+    for tree in yaml_trees:
+        if tree:
+            _deep_update(yaml_tree, tree)
 
     user_cli, default_cli = OmegaConf.from_argparse(
         parser, include_none=include_none, args=args
     )
 
-    configs = (
-        [default_cli, dict_config, user_cli] if not use_only_default else [default_cli]
-    )
-
+    configs = [default_cli, OmegaConf.create(yaml_tree), user_cli]
     tomerge = [cfg for cfg in configs if cfg is not None and len(cfg.keys()) > 0]
-    config = OmegaConf.merge(*tomerge)
 
-    return config
+    return _merge_configs(tomerge)
 
 
 def generate_config_template(
@@ -201,5 +674,12 @@ def generate_config_template(
         args (Optional[List[str]]): Optional input sys.argv style args. Useful for testing.
             Use this only for testing. By default it uses sys.argv[1:]
     """
-    config = parse_config(parser, None, include_none=True, use_only_default=True)
-    OmegaConf.save(config, output_file)
+    # This is a purely-defaults operation: nest the parsed namespace directly
+    # and dump it, skipping the merge pipeline of parse_config.
+    ns = parser.parse_args(args=args)
+    tree: Dict[str, Any] = {}
+
+    for k, v in ns.__dict__.items():
+        _insert(tree, k.split("."), v)
+
+    OmegaConf.save(OmegaConf.create(tree), output_file)